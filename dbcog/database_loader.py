@@ -21,7 +21,7 @@ def load_database(existing_db, debug_monster_ids):
         existing_db.close()
     # Overwrite the working copy so we can open a handle to it without affecting future downloads
     if os.path.exists(DB_DUMP_FILE):
-        shutil.copy2(DB_DUMP_FILE, DB_DUMP_WORKING_FILE)
+        shutil.copyfile(DB_DUMP_FILE, DB_DUMP_WORKING_FILE)
     # Open the new working copy.
     database = DBCogDatabase(data_file=DB_DUMP_WORKING_FILE)
     graph = MonsterGraph(database, debug_monster_ids)
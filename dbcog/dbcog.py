@@ -7,6 +7,7 @@ Don't hold on to any of the dastructures exported from here, or the
 entire database could be leaked when the module is reloaded.
 """
 import asyncio
+import hashlib
 import logging
 import os
 import shutil
@@ -38,11 +39,27 @@ from dbcog.find_monster.token_mappings import MONSTER_ATTR_ALIAS_TO_ATTR_MAP, MO
 
 logger = logging.getLogger('red.padbot-cogs.dbcog')
 
+# Leaves room for the code block markers that box() adds around a page
+DISCORD_PAGE_LENGTH = 1990
+
+# Seconds a user's merged fm_flags are reused for before being read from config again
+FM_FLAGS_CACHE_TTL = 60
+
 
 def _data_file(file_name: str) -> str:
     return os.path.join(str(data_manager.cog_data_path(raw_name='dbcog')), file_name)
 
 
+def _file_digest(file_path: str) -> Optional[str]:
+    if not os.path.exists(file_path):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 # TODO: Find a way to get literal back
 class LiteralConverter:
     def __class_getitem__(cls, *_):
@@ -58,15 +75,22 @@ class DBCog(commands.Cog, IdTest):
         self._is_ready = asyncio.Event()
 
         self.database: Optional[DbContext] = None
+        # (file digest, debug monster ids) of the currently loaded database
+        self._database_fingerprint: Optional[Tuple[Optional[str], Optional[Tuple[int, ...]]]] = None
         self.indexes: Dict[Server, MonsterIndex] = {
             Server.COMBINED: MonsterIndex(Server.COMBINED),
             Server.NA: MonsterIndex(Server.NA),
         }
+        self._index_locks: Dict[Server, asyncio.Lock] = {server: asyncio.Lock() for server in SERVERS}
+        self._index_generation = 0
+        self._index_built_generation: Dict[Server, int] = {}
+        self._index_prebuild_task: Optional[asyncio.Task] = None
 
         self.fir_lock = asyncio.Lock()
         self.fir3_lock = asyncio.Lock()
 
         self.fm_flags_default = {'na_prio': True, 'server': DEFAULT_SERVER, 'ormod_prio': False}
+        self._fm_flags_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
         self.config = Config.get_conf(self, identifier=64667103)
         self.config.register_global(datafile='', indexlog=0, test_suite={}, fluff_suite=[], typo_mods=[],
                                     debug_mode=False, debug_mode_monsters=[3260])
@@ -128,41 +152,82 @@ class DBCog(commands.Cog, IdTest):
     async def red_delete_data_for_user(self, *, requester, user_id):
         """Delete a user's personal data."""
         await self.config.user_from_id(user_id).clear()
+        self.invalidate_fm_flags(user_id)
 
     @commands.command(aliases=['fir'])
     @auth_check('contentadmin')
     async def forceindexreload(self, ctx):
-        if self.fir_lock.locked():
-            await ctx.send("Index is already being reloaded.")
+        if await self._notify_if_reloading(ctx, self.fir_lock):
             return
 
-        async with ctx.typing(), self.fir_lock:
+        async with self.fir_lock, ctx.typing():
             start = time.perf_counter()
             await ctx.send('Starting reload...')
             await self.wait_until_ready()
             await self.download_and_refresh_nicknames()
+            await self.wait_until_indexes_built()
             await ctx.send('Reload finished in {} seconds.'.format(round(time.perf_counter() - start, 2)))
 
     @commands.command(aliases=['fir3'])
     @auth_check('contentadmin')
     async def forceindexreload3(self, ctx):
-        if self.fir3_lock.locked():
-            await ctx.send("Index is already being reloaded.")
+        if await self._notify_if_reloading(ctx, self.fir3_lock):
             return
 
-        async with ctx.typing(), self.fir3_lock:
+        async with self.fir3_lock, ctx.typing():
             start = time.perf_counter()
             await self.wait_until_ready()
             await self.create_index()
+            await self.wait_until_indexes_built()
             await ctx.send('Reload finished in {} seconds.'.format(round(time.perf_counter() - start, 2)))
 
+    @staticmethod
+    async def _notify_if_reloading(ctx, lock: asyncio.Lock) -> bool:
+        if lock.locked():
+            await ctx.send("Index is already being reloaded.")
+            return True
+        return False
+
     async def create_index(self):
-        """Exported function that allows a client cog to create an id3 monster index"""
-        for server in SERVERS:
-            await self.indexes[server].reset(self.database.graph)
+        """Exported function that allows a client cog to create an id3 monster index
+
+        Only the default server's index is built before returning.  The others are warmed in the
+        background and built on demand by `get_index` if they're requested first.
+        """
+        self._index_generation += 1
+        await self._build_index(DEFAULT_SERVER)
 
         self.mon_finder = FindMonster(self, self.fm_flags_default)
-        asyncio.create_task(self.check_index())
+        if self._index_prebuild_task is not None:
+            self._index_prebuild_task.cancel()
+        self._index_prebuild_task = asyncio.create_task(self._prebuild_other_servers())
+
+    def _index_is_current(self, server: Server) -> bool:
+        return self._index_built_generation.get(server) == self._index_generation
+
+    async def _build_index(self, server: Server) -> None:
+        async with self._index_locks[server]:
+            generation = self._index_generation
+            if self._index_built_generation.get(server) != generation:
+                await self.indexes[server].reset(self.database.graph)
+                self._index_built_generation[server] = generation
+
+    async def _prebuild_other_servers(self) -> None:
+        try:
+            for server in SERVERS:
+                if server != DEFAULT_SERVER:
+                    await self._build_index(server)
+            await self.check_index()
+        except Exception as ex:
+            # Nothing awaits this task, so log here.  get_index will retry the build on demand.
+            logger.exception("DBCog background index build failed: %s", ex)
+
+    async def wait_until_indexes_built(self) -> None:
+        """Wait for the background build of the non-default server indexes started by create_index"""
+        # asyncio.wait neither raises if the task was cancelled nor cancels it if we are, and a newer
+        # create_index may replace the task while we wait
+        while self._index_prebuild_task is not None and not self._index_prebuild_task.done():
+            await asyncio.wait({self._index_prebuild_task})
 
     async def load_old_index(self):
         data = b'\x80\x04}\x94.'
@@ -205,7 +270,9 @@ class DBCog(commands.Cog, IdTest):
                     await channel.send(box(page))
 
     async def get_index(self, server: Server = DEFAULT_SERVER) -> MonsterIndex:
-        await self.indexes[server].is_ready.wait()
+        await self.wait_until_ready()
+        if not self._index_is_current(server):
+            await self._build_index(server)
         return self.indexes[server]
 
     def get_monster(self, monster_id: int, *, server: Server = DEFAULT_SERVER) -> Optional[MonsterModel]:
@@ -215,6 +282,9 @@ class DBCog(commands.Cog, IdTest):
     def cog_unload(self):
         # Manually nulling out database because the GC for cogs seems to be pretty shitty
         logger.info('Unloading DBCog')
+        if self._index_prebuild_task is not None:
+            self._index_prebuild_task.cancel()
+            self._index_prebuild_task = None
         if self.database:
             self.database.close()
         self.database = None
@@ -231,7 +301,7 @@ class DBCog(commands.Cog, IdTest):
             short_wait = False
             try:
                 async with StatusManager(self.bot):
-                    await self.download_and_refresh_nicknames()
+                    await self.download_and_refresh_nicknames(force_reload=False)
                 logger.info('Done refreshing DBCog')
             except Exception as ex:
                 short_wait = True
@@ -244,18 +314,32 @@ class DBCog(commands.Cog, IdTest):
                 logger.exception("DBCog data wait loop failed: %s", ex)
                 raise
 
-    async def download_and_refresh_nicknames(self):
+    async def download_and_refresh_nicknames(self, force_reload: bool = True):
+        """Refresh the database file and rebuild the monster index
+
+        Unless force_reload is set, the database isn't reloaded if the file and debug monsters
+        haven't changed since the last load.  The index is always rebuilt to pick up sheet changes.
+        """
         if await self.config.datafile():
             logger.info('Copying database file')
-            shutil.copy2(await self.config.datafile(), self.db_file_path)
+            # Only the contents matter here, and copyfile can use sendfile on Linux
+            await asyncio.get_running_loop().run_in_executor(
+                None, shutil.copyfile, await self.config.datafile(), self.db_file_path)
         else:
             logger.info('Downloading database files')
             await async_cached_dadguide_request(self.db_file_path,
                                                 CLOUDFRONT_URL + '/db/dadguide.sqlite',
                                                 1 * 60 * 60)
 
-        logger.info('Loading database')
-        self.database = load_database(self.database, await self.get_debug_monsters())
+        debug_monsters = await self.get_debug_monsters()
+        digest = await asyncio.get_running_loop().run_in_executor(None, _file_digest, self.db_file_path)
+        fingerprint = (digest, tuple(debug_monsters) if debug_monsters is not None else None)
+        if force_reload or self.database is None or fingerprint != self._database_fingerprint:
+            logger.info('Loading database')
+            self.database = load_database(self.database, debug_monsters)
+            self._database_fingerprint = fingerprint
+        else:
+            logger.info('Database file is unchanged, skipping load')
         logger.info('Building monster index, triggering ready')
         self._is_ready.set()
         await self.create_index()
@@ -327,10 +411,19 @@ class DBCog(commands.Cog, IdTest):
 
     @debug_monsters.command(name="list")
     async def debug_monsters_list(self, ctx):
-        text = "\n".join(f'{m} {mon.name_en}' if (mon := self.get_monster(m)) else f"Invalid monster {m}"
-                         for m in await self.config.debug_mode_monsters())
-        for page in pagify(text):
-            await ctx.send(box(page))
+        lines = {}
+        page, page_len = [], 0
+        for m in await self.config.debug_mode_monsters():
+            if m not in lines:
+                lines[m] = f'{m} {mon.name_en}' if (mon := self.get_monster(m)) else f"Invalid monster {m}"
+            line = lines[m]
+            if page and page_len + len(line) + 1 > DISCORD_PAGE_LENGTH:
+                await ctx.send(box("\n".join(page)))
+                page, page_len = [], 0
+            page.append(line)
+            page_len += len(line) + 1
+        if page:
+            await ctx.send(box("\n".join(page)))
 
     async def get_debug_monsters(self) -> Optional[List[int]]:
         if await self.config.debug_mode():
@@ -338,7 +431,23 @@ class DBCog(commands.Cog, IdTest):
         return None
 
     async def get_fm_flags(self, author_id):
-        return {**self.fm_flags_default, **(await self.config.user_from_id(author_id).fm_flags())}
+        now = time.monotonic()
+        cached = self._fm_flags_cache.get(author_id)
+        if cached is not None and now - cached[0] < FM_FLAGS_CACHE_TTL:
+            return dict(cached[1])
+        # Only misses can grow the cache, so drop everything that has gone stale before adding to it
+        self._prune_fm_flags_cache(now)
+        flags = {**self.fm_flags_default, **(await self.config.user_from_id(author_id).fm_flags())}
+        self._fm_flags_cache[author_id] = (time.monotonic(), flags)
+        return dict(flags)
+
+    def _prune_fm_flags_cache(self, now: float):
+        self._fm_flags_cache = {author_id: cached for author_id, cached in self._fm_flags_cache.items()
+                                if now - cached[0] < FM_FLAGS_CACHE_TTL}
+
+    def invalidate_fm_flags(self, author_id):
+        """Call this after changing a user's fm_flags so their next query sees the change"""
+        self._fm_flags_cache.pop(author_id, None)
 
     async def find_monster(self, query: str, author_id: int = 0) -> Optional[MonsterModel]:
         monster, e_info = await FindMonster(self, await self.get_fm_flags(author_id)).find_monster(query)
@@ -1,4 +1,6 @@
 import re
+from collections import Counter
+from functools import cached_property
 from typing import Set
 
 import romkan
@@ -28,6 +30,10 @@ class MonsterModel(BaseModel):
 
         self.awakenings = sorted(m['awakenings'], key=lambda a: a.order_idx)
         self.superawakening_count = sum(int(a.is_super) for a in self.awakenings)
+        self.normal_awakening_count = len(self.awakenings) - self.superawakening_count
+        self.normal_awakenings = self.awakenings[:self.normal_awakening_count]
+        self.super_awakenings = self.awakenings[self.normal_awakening_count:]
+        self._awakening_counts = Counter(a.awoken_skill_id for a in self.awakenings)
         self.leader_skill: LeaderSkillModel = m['leader_skill']
         self.leader_skill_id = self.leader_skill.leader_skill_id if self.leader_skill else None
         self.active_skill: ActiveSkillModel = m['active_skill']
@@ -63,6 +69,7 @@ class MonsterModel(BaseModel):
         self.type2 = enum_or_none(MonsterType, m['type_2_id'])
         self.type3 = enum_or_none(MonsterType, m['type_3_id'])
         self.types = list(filter(None, [self.type1, self.type2, self.type3]))
+        self.type_names = frozenset(t.name for t in self.types)
 
         self.rarity = m['rarity']
         self.is_farmable = m['is_farmable']
@@ -111,7 +118,9 @@ class MonsterModel(BaseModel):
 
         self.server_priority = m['server_priority']
 
-    @property
+        self._stats_cache = {}
+
+    @cached_property
     def killers(self):
         type_to_killers_map = {
             MonsterType.God: ['Devil'],
@@ -170,13 +179,17 @@ class MonsterModel(BaseModel):
         return int(self.exp_curve * ((target_level - 1) / 98) ** 2.5)
 
     def awakening_count(self, awid):
-        return len([x for x in self.awakenings if x.awoken_skill_id == awid])
+        return self._awakening_counts[awid]
 
     def stat(self, key, lv, plus=99, inherit=False, is_plus_297=True):
         return monster_stats.stat(self, key, lv, plus=plus, inherit=inherit, is_plus_297=is_plus_297)
 
     def stats(self, lv=99, plus=0, inherit=False, multiplayer: bool = False):
-        return monster_stats.stats(self, lv, plus=plus, inherit=inherit, multiplayer=multiplayer)
+        key = (lv, plus, inherit, multiplayer)
+        if key not in self._stats_cache:
+            self._stats_cache[key] = monster_stats.stats(self, lv, plus=plus, inherit=inherit,
+                                                         multiplayer=multiplayer)
+        return self._stats_cache[key]
 
     @staticmethod
     def make_roma_subname(name_ja):
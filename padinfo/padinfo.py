@@ -54,7 +54,7 @@ from padinfo.view.button_info import ButtonInfoToggles, ButtonInfoViewState
 from padinfo.view.common import invalid_monster_text
 from padinfo.view.evos import EvosViewState
 from padinfo.view.experience_curve import ExperienceCurveView, ExperienceCurveViewProps
-from padinfo.view.id import IdViewState
+from padinfo.view.id import IdViewState, clear_misc_info_cache
 from padinfo.view.id_traceback import IdTracebackView, IdTracebackViewProps
 from padinfo.view.leader_skill import LeaderSkillViewState
 from padinfo.view.leader_skill_single import LeaderSkillSingleViewState
@@ -110,12 +110,16 @@ class PadInfo(commands.Cog):
         self.config.register_global(sometimes_perc=20, good=0, bad=0, bad_queries=[])
 
         self.historic_lookups_file_path = _data_file('historic_lookups_id3.json')
-        self.historic_lookups = safe_read_json(self.historic_lookups_file_path)
+        self._historic_lookups = None
 
         self.awoken_emoji_names = {v: k for k, v in AWAKENING_ID_TO_EMOJI_NAME_MAP.items()}
         self.get_attribute_emoji_by_monster = get_attribute_emoji_by_monster
         self.settings = settings
 
+    def cog_unload(self):
+        # Don't keep DBCog's monsters alive through our memos once we're unloaded
+        clear_misc_info_cache()
+
     async def red_get_data_for_user(self, *, user_id):
         """Get a user's personal data."""
         idhist = await self.config.user_from_id(user_id).id_history()
@@ -161,9 +165,19 @@ class PadInfo(commands.Cog):
         await dbcog.wait_until_ready()
         return dbcog
 
-    def save_historic_data(self, query, monster: Optional["MonsterModel"]):
-        self.historic_lookups[query] = monster.monster_id if monster else -1
-        json.dump(self.historic_lookups, open(self.historic_lookups_file_path, "w+"))
+    async def get_historic_lookups(self) -> dict:
+        """Read the historic lookups on first use so loading the cog doesn't block on disk"""
+        if self._historic_lookups is None:
+            historic_lookups = await asyncio.get_running_loop().run_in_executor(
+                None, safe_read_json, self.historic_lookups_file_path)
+            if self._historic_lookups is None:
+                self._historic_lookups = historic_lookups
+        return self._historic_lookups
+
+    async def save_historic_data(self, query, monster: Optional["MonsterModel"]):
+        historic_lookups = await self.get_historic_lookups()
+        historic_lookups[query] = monster.monster_id if monster else -1
+        json.dump(historic_lookups, open(self.historic_lookups_file_path, "w+"))
 
     async def get_menu_default_data(self, ims):
         data = {
@@ -222,7 +236,7 @@ class PadInfo(commands.Cog):
         raw_query = query
 
         if (monster := await self._get_monster(ctx, query)) is None:
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         # id3 messaging stuff
@@ -233,7 +247,7 @@ class PadInfo(commands.Cog):
                             ctx.author.id in self.bot.get_cog("PadGlobal").settings.bot_settings['admins'] else ""))
 
         alt_monsters = IdViewState.get_alt_monsters_and_evos(dbcog, monster)
-        id_queried_props = await IdViewState.do_query(dbcog, monster)
+        id_queried_props = IdViewState.do_query(dbcog, monster)
         full_reaction_list = IdMenuPanes.emoji_names()
         initial_reaction_list = await get_id_menu_initial_reaction_list(ctx, dbcog, monster, full_reaction_list)
         is_jp_buffed = dbcog.database.graph.monster_is_discrepant(monster)
@@ -245,7 +259,7 @@ class PadInfo(commands.Cog):
         menu = IdMenu.menu()
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @staticmethod
     async def send_invalid_monster_message(ctx, query: str, monster: "MonsterModel", append_text: str):
@@ -262,11 +276,11 @@ class PadInfo(commands.Cog):
         monster = await dbcog.find_monster(raw_query, ctx.author.id)
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         alt_monsters = IdViewState.get_alt_monsters_and_evos(dbcog, monster)
-        id_queried_props = await IdViewState.do_query(dbcog, monster)
+        id_queried_props = IdViewState.do_query(dbcog, monster)
 
         is_jp_buffed = dbcog.database.graph.monster_is_discrepant(monster)
         query_settings = await QuerySettings.extract_raw(ctx.author, self.bot, query)
@@ -281,7 +295,7 @@ class PadInfo(commands.Cog):
             menu = NaDiffMenu.menu(initial_control=NaDiffMenu.message_control)
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command(name="evos")
     @checks.bot_has_permissions(embed_links=True)
@@ -295,7 +309,7 @@ class PadInfo(commands.Cog):
 
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         alt_monsters = EvosViewState.get_alt_monsters_and_evos(dbcog, monster)
@@ -318,7 +332,7 @@ class PadInfo(commands.Cog):
         menu = IdMenu.menu(initial_control=IdMenu.evos_control)
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command(name="mats", aliases=['evomats', 'evomat', 'skillups'])
     @checks.bot_has_permissions(embed_links=True)
@@ -331,7 +345,7 @@ class PadInfo(commands.Cog):
 
         if not monster:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         mats, usedin, gemid, gemusedin, skillups, skillup_evo_count, link, gem_override = \
@@ -355,7 +369,7 @@ class PadInfo(commands.Cog):
         menu = IdMenu.menu(initial_control=IdMenu.mats_control)
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command(aliases=["series", "panth"])
     @checks.bot_has_permissions(embed_links=True)
@@ -369,7 +383,7 @@ class PadInfo(commands.Cog):
 
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         pantheon_list, series_name, base_monster = await PantheonViewState.do_query(dbcog, monster)
@@ -391,7 +405,7 @@ class PadInfo(commands.Cog):
         menu = IdMenu.menu(initial_control=IdMenu.pantheon_control)
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command(aliases=['img'])
     @checks.bot_has_permissions(embed_links=True)
@@ -405,7 +419,7 @@ class PadInfo(commands.Cog):
 
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         alt_monsters = PicViewState.get_alt_monsters_and_evos(dbcog, monster)
@@ -421,7 +435,7 @@ class PadInfo(commands.Cog):
         menu = IdMenu.menu(initial_control=IdMenu.pic_control)
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command(aliases=['stats'])
     @checks.bot_has_permissions(embed_links=True)
@@ -435,7 +449,7 @@ class PadInfo(commands.Cog):
 
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
 
         alt_monsters = PicViewState.get_alt_monsters_and_evos(dbcog, monster)
@@ -451,7 +465,7 @@ class PadInfo(commands.Cog):
         menu = IdMenu.menu(initial_control=IdMenu.otherinfo_control)
         await menu.create(ctx, state)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command()
     @checks.bot_has_permissions(embed_links=True)
@@ -461,14 +475,14 @@ class PadInfo(commands.Cog):
         monster = await dbcog.find_monster(query, ctx.author.id)
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
         await self.log_id_result(ctx, monster.monster_id)
         query_settings = await QuerySettings.extract_raw(ctx.author, self.bot, query)
         embed = LinksView.embed(monster, query_settings).to_embed()
         await ctx.send(embed=embed)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     @commands.command()
     @checks.bot_has_permissions(embed_links=True)
@@ -478,14 +492,14 @@ class PadInfo(commands.Cog):
         monster = await dbcog.find_monster(query, ctx.author.id)
         if monster is None:
             await self.send_id_failure_message(ctx, query)
-            self.save_historic_data(query, monster)
+            await self.save_historic_data(query, monster)
             return
         await self.log_id_result(ctx, monster.monster_id)
         query_settings = await QuerySettings.extract_raw(ctx.author, self.bot, query)
         embed = LookupView.embed(monster, query_settings).to_embed()
         await ctx.send(embed=embed)
         await self.log_id_result(ctx, monster.monster_id)
-        self.save_historic_data(query, monster)
+        await self.save_historic_data(query, monster)
 
     async def log_id_result(self, ctx, monster_id: int):
         history = await self.config.user(ctx.author).id_history()
@@ -662,7 +676,7 @@ class PadInfo(commands.Cog):
         }
 
         alt_monsters = IdViewState.get_alt_monsters_and_evos(dbcog, monster)
-        id_queried_props = await IdViewState.do_query(dbcog, monster)
+        id_queried_props = IdViewState.do_query(dbcog, monster)
         full_reaction_list = IdMenuPanes.emoji_names()
         is_jp_buffed = dbcog.database.graph.monster_is_discrepant(monster)
 
@@ -958,6 +972,7 @@ class PadInfo(commands.Cog):
 
         async with self.bot.get_cog("DBCog").config.user(ctx.author).fm_flags() as fm_flags:
             fm_flags['embedcolor'] = color
+        self.bot.get_cog("DBCog").invalidate_fm_flags(ctx.author.id)
         await ctx.tick()
 
     @idset.command(usage="<on/off>")
@@ -966,6 +981,7 @@ class PadInfo(commands.Cog):
         async with self.bot.get_cog("DBCog").config.user(ctx.author).fm_flags() as fm_flags:
             # The current na_prio enum has 0 and 1 instead of False and True as its values
             fm_flags['na_prio'] = int(value)
+        self.bot.get_cog("DBCog").invalidate_fm_flags(ctx.author.id)
         await send_confirmation_message(
             ctx, f"NA monster prioritization has been **{'en' if value else 'dis'}abled**.")
 
@@ -974,6 +990,7 @@ class PadInfo(commands.Cog):
         """Whether `[p]id` will be order-sensitive with respect to your "or" clauses"""
         async with self.bot.get_cog("DBCog").config.user(ctx.author).fm_flags() as fm_flags:
             fm_flags['ormod_prio'] = bool(value)
+        self.bot.get_cog("DBCog").invalidate_fm_flags(ctx.author.id)
         await send_confirmation_message(
             ctx, f"Order in or clause prioritization has been **{'en' if value else 'dis'}abled**.")
 
@@ -996,6 +1013,7 @@ class PadInfo(commands.Cog):
                 else:
                     await send_cancellation_message(ctx, "Server must be `na` or `combined`")
                 return
+        dbcog.invalidate_fm_flags(ctx.author.id)
         await ctx.tick()
 
     @idset.command()
@@ -1093,6 +1111,7 @@ class PadInfo(commands.Cog):
                     ctx,
                     f'Please input an allowed value, either `{value1}` or `{value2}`.')
                 return
+        self.bot.get_cog("DBCog").invalidate_fm_flags(ctx.author.id)
         await send_confirmation_message(
             ctx,
             f"Your default `{ctx.prefix}id` {setting_name} preference has been set to **{value}**. You can temporarily access `{not_value}` with the flag `--{not_value_flag}` in your queries.")
@@ -54,15 +54,11 @@ def _get_all_awakening_descs(awakening_list, show_help, token_map):
 
 
 def get_normal_awakenings(monster: "MonsterModel", show_help: bool, token_map: dict):
-    normal_awakening_count = len(monster.awakenings) - monster.superawakening_count
-    normal_awakenings = monster.awakenings[:normal_awakening_count]
-    return _get_all_awakening_descs(normal_awakenings, show_help, token_map)
+    return _get_all_awakening_descs(monster.normal_awakenings, show_help, token_map)
 
 
 def get_super_awakenings(monster: "MonsterModel", show_help: bool, token_map: dict):
-    normal_awakening_count = len(monster.awakenings) - monster.superawakening_count
-    super_awakenings = monster.awakenings[normal_awakening_count:]
-    return _get_all_awakening_descs(super_awakenings, show_help, token_map)
+    return _get_all_awakening_descs(monster.super_awakenings, show_help, token_map)
 
 
 class AwakeningHelpView:
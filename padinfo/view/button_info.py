@@ -47,8 +47,7 @@ class ButtonInfoViewState(ViewStateBase, EvoScrollViewState):
         self.info = info
         self.query_settings = query_settings
 
-        self.alt_monsters = alt_monsters
-        self.alt_monster_ids = [m.monster.monster_id for m in self.alt_monsters]
+        self.set_alt_monsters(alt_monsters)
 
     def serialize(self):
         ret = super().serialize()
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, TYPE_CHECKING
 
 from discordmenu.embed.base import Box
 from discordmenu.embed.text import BoldText, Text
@@ -11,6 +12,41 @@ if TYPE_CHECKING:
     from dbcog.models.awakening_model import AwokenSkillModel
 
 
+class SourceBoundCache:
+    """A memo whose entries are derived from `source` and dropped once a different source is passed in
+
+    Sources that support it are only weakly referenced, and the entries are dropped as soon as the source
+    is collected, so the memo never keeps e.g. an unloaded DBCog's database alive.
+    """
+
+    def __init__(self):
+        self.cache: Dict[Hashable, Any] = {}
+        self._source_ref: Optional[Callable[[], Any]] = None
+
+    def get(self, source: Any, key: Hashable, make_value: Callable[[], Any]) -> Any:
+        if self._source_ref is None or self._source_ref() is not source:
+            self.clear()
+            self._source_ref = self._make_ref(source)
+        if key not in self.cache:
+            self.cache[key] = make_value()
+        return self.cache[key]
+
+    def clear(self) -> None:
+        self.cache = {}
+        self._source_ref = None
+
+    def _make_ref(self, source: Any) -> Callable[[], Any]:
+        def on_collected(ref):
+            if self._source_ref is ref:
+                self.clear()
+
+        try:
+            return weakref.ref(source, on_collected)
+        except TypeError:
+            # Builtins like list can't be weakly referenced; hold those directly
+            return lambda: source
+
+
 async def get_monster_from_ims(dbcog, ims: dict):
     query = ims.get('query') or ims['raw_query']
     query_settings = QuerySettings.deserialize(ims.get('query_settings'))
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Hashable, List, Optional, TYPE_CHECKING
 
 import jinja2
 from discordmenu.embed.base import Box
@@ -11,6 +11,7 @@ from tsutils.tsubaki.custom_emoji import get_awakening_emoji, get_emoji, number_
 
 from padinfo.core.leader_skills import ls_multiplier_text, ls_single_multiplier_text
 from padinfo.view.base import BaseIdView
+from padinfo.view.common import SourceBoundCache
 from padinfo.view.components.view_state_base_id import ViewStateBaseId
 
 if TYPE_CHECKING:
@@ -20,8 +21,17 @@ if TYPE_CHECKING:
     from dbcog.models.awoken_skill_model import AwokenSkillModel
 
 
+# Emoji text only changes when the emoji cache is refreshed, so it's memoised until custom_emojis is replaced
+_emoji_text_cache = SourceBoundCache()
+
+
+def _cached_emoji_text(key: Hashable, make_text: Callable[[], str]) -> str:
+    return _emoji_text_cache.get(emoji_cache.custom_emojis, key, make_text)
+
+
 def _get_awakening_text(awakening: "AwakeningModel"):
-    return get_awakening_emoji(awakening.awoken_skill_id, awakening.name)
+    return _cached_emoji_text(('awakening', awakening.awoken_skill_id, awakening.name),
+                              lambda: get_awakening_emoji(awakening.awoken_skill_id, awakening.name))
 
 
 def _killer_latent_emoji(latent_name: str):
@@ -50,14 +60,12 @@ class BaseIdMainView(BaseIdView, ABC):
 
     @staticmethod
     def normal_awakenings_row(m: "MonsterModel"):
-        normal_awakenings = len(m.awakenings) - m.superawakening_count
-        normal_awakenings_emojis = [_get_awakening_text(a) for a in m.awakenings[:normal_awakenings]]
+        normal_awakenings_emojis = [_get_awakening_text(a) for a in m.normal_awakenings]
         return Box(*[Text(e) for e in normal_awakenings_emojis], delimiter=' ')
 
     @staticmethod
     def super_awakenings_row(m: "MonsterModel"):
-        normal_awakenings = len(m.awakenings) - m.superawakening_count
-        super_awakenings_emojis = [_get_awakening_text(a) for a in m.awakenings[normal_awakenings:]]
+        super_awakenings_emojis = [_get_awakening_text(a) for a in m.super_awakenings]
         return Box(
             Text(get_emoji('sa_questionmark')),
             *[Text(e) for e in super_awakenings_emojis],
@@ -66,8 +74,9 @@ class BaseIdMainView(BaseIdView, ABC):
     @staticmethod
     def killers_row(m: "MonsterModel", transform_base):
         killers = m.killers if m == transform_base else transform_base.killers
-        killers_text = 'Any' if 'Any' in killers else \
-            ' '.join(_killer_latent_emoji(k) for k in killers)
+        killers_text = _cached_emoji_text(('killers', tuple(killers)),
+                                          lambda: 'Any' if 'Any' in killers else
+                                          ' '.join(_killer_latent_emoji(k) for k in killers))
         return Box(
             BoldText('Available killers:'),
             Text('\N{DOWN-POINTING RED TRIANGLE}' if m != transform_base else ''),
@@ -88,8 +97,7 @@ class BaseIdMainView(BaseIdView, ABC):
             active_cd = "({} -> {})".format(active_skill.cooldown_turns_max, active_skill.cooldown_turns_min)
         else:
             skill_texts = []
-            previous_transforms.reverse()
-            for i, mon in enumerate(previous_transforms):
+            for i, mon in enumerate(reversed(previous_transforms)):
                 skill = mon.active_skill
                 # we can assume skill is not None because the monster transforms
                 cooldown_text = '({}cd)'.format(str(skill.cooldown_turns_max))
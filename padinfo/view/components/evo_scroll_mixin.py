@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, NamedTuple, Optional, TYPE_CHECKING
+from typing import Dict, List, NamedTuple, Optional, TYPE_CHECKING
 
 from discordmenu.embed.components import EmbedField
 from discordmenu.embed.text import HighlightableLinks, LinkedText
@@ -18,20 +18,42 @@ class MonsterEvolution(NamedTuple):
 
 class EvoScrollViewState:
     alt_monster_ids: List[int]
+    alt_labels: List[str]
     monster: "MonsterModel"
     alt_monsters: List["MonsterEvolution"]
+    alt_id_to_idx: Dict[int, int]
+    alt_has_irreversible: bool
+    alt_has_equip: bool
     query_settings: QuerySettings
 
+    def set_alt_monsters(self, alt_monsters: List["MonsterEvolution"]):
+        self.alt_monsters = alt_monsters
+
+        # These are read on every render of the evos field, so compute them once per state,
+        # in a single pass, as lists parallel to alt_monsters
+        self.alt_monster_ids = []
+        self.alt_labels = []
+        self.alt_has_irreversible = False
+        self.alt_has_equip = False
+        for me in alt_monsters:
+            is_equip = me.monster.is_equip
+            reversible = not me.evolution or me.evolution.reversible
+            self.alt_monster_ids.append(me.monster.monster_id)
+            self.alt_labels.append(EvoScrollView.alt_label(is_equip, reversible, me.monster.monster_no_na))
+            self.alt_has_irreversible |= not reversible
+            self.alt_has_equip |= is_equip
+        self.alt_id_to_idx = {mid: i for i, mid in enumerate(self.alt_monster_ids)}
+
     def decrement_monster(self, dbcog, ims: dict):
 
         # if this ever has a side effect in the actual class, it cannot remain as a mixin!
 
-        index = self.alt_monster_ids.index(self.monster.monster_id)
+        index = self.alt_id_to_idx[self.monster.monster_id]
         prev_monster_id = self.alt_monster_ids[index - 1]
         ims['resolved_monster_id'] = str(prev_monster_id)
 
     def increment_monster(self, dbcog, ims: dict):
-        index = self.alt_monster_ids.index(self.monster.monster_id)
+        index = self.alt_id_to_idx[self.monster.monster_id]
         if index == len(self.alt_monster_ids) - 1:
             # cycle back to the beginning of the evos list
             next_monster_id = self.alt_monster_ids[0]
@@ -58,9 +80,9 @@ class EvoScrollView:
         # this isn't used right now, but maybe later if discord changes the api for embed titles...?
         _help_link = "https://github.com/TsubakiBotPad/pad-cogs/wiki/Evolutions-mini-view"
         legend_parts = []
-        if any(not alt_evo.evolution.reversible for alt_evo in state.alt_monsters if alt_evo.evolution):
+        if state.alt_has_irreversible:
             legend_parts.append("⌊Irreversible⌋")
-        if any(alt_evo.monster.is_equip for alt_evo in state.alt_monsters):
+        if state.alt_has_equip:
             legend_parts.append("⌈Equip⌉")
         if legend_parts:
             help_text = ' – Help: {}'.format(" ".join(legend_parts))
@@ -68,20 +90,19 @@ class EvoScrollView:
             field_text + help_text,
             HighlightableLinks(
                 links=[LinkedText(
-                    EvoScrollView.alt_fmt(evo),
+                    label,
                     MonsterLink.header_link(evo.monster, state.query_settings)
-                ) for evo in state.alt_monsters],
-                highlighted=next(i for i, me in enumerate(state.alt_monsters)
-                                 if state.monster.monster_id == me.monster.monster_id)
+                ) for label, evo in zip(state.alt_labels, state.alt_monsters)],
+                highlighted=state.alt_id_to_idx[state.monster.monster_id]
             )
         )
 
     @staticmethod
-    def alt_fmt(evo: MonsterEvolution):
-        if evo.monster.is_equip:
+    def alt_label(is_equip: bool, reversible: bool, monster_no_na: int):
+        if is_equip:
             fmt = "⌈{}⌉"
-        elif not evo.evolution or evo.evolution.reversible:
+        elif reversible:
             fmt = "{}"
         else:
             fmt = "⌊{}⌋"
-        return fmt.format(evo.monster.monster_no_na)
+        return fmt.format(monster_no_na)
@@ -27,11 +27,9 @@ class ViewStateBaseId(ViewState, EvoScrollViewState):
         self.query_settings = query_settings
 
         if self.query_settings.evosort == AltEvoSort.dfs:
-            self.alt_monsters = self.dfs_alt_monsters
+            self.set_alt_monsters(self.dfs_alt_monsters)
         else:
-            self.alt_monsters = sorted(self.dfs_alt_monsters, key=lambda m: m.monster.monster_id)
-
-        self.alt_monster_ids = [m.monster.monster_id for m in self.alt_monsters]
+            self.set_alt_monsters(sorted(self.dfs_alt_monsters, key=lambda m: m.monster.monster_id))
 
     def serialize(self):
         ret = super().serialize()
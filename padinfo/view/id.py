@@ -13,7 +13,7 @@ from tsutils.tsubaki.custom_emoji import get_awakening_emoji, get_emoji
 from tsutils.tsubaki.links import MonsterImage, MonsterLink
 from tsutils.tsubaki.monster_header import MonsterHeader
 
-from padinfo.view.common import get_monster_from_ims, invalid_monster_text
+from padinfo.view.common import SourceBoundCache, get_monster_from_ims, invalid_monster_text
 from padinfo.view.components.base_id_main_view import BaseIdMainView
 from padinfo.view.components.evo_scroll_mixin import EvoScrollView, MonsterEvolution
 from padinfo.view.components.view_state_base_id import ViewStateBaseId
@@ -25,6 +25,14 @@ if TYPE_CHECKING:
     from dbcog.database_context import DbContext
 
 
+# Misc info is a pure function of the graph, so it's memoised until DBCog loads a new database
+_misc_info_cache = SourceBoundCache()
+
+
+def clear_misc_info_cache():
+    _misc_info_cache.clear()
+
+
 class IdQueriedProps:
     def __init__(self, acquire_raw, base_rarity, transform_base, true_evo_type_raw, previous_evolutions,
                  previous_transforms, awoken_skill_map: Dict[int, "AwokenSkillModel"]):
@@ -77,7 +85,7 @@ class IdViewState(ViewStateBaseId):
             return None
         monster = await get_monster_from_ims(dbcog, ims)
         alt_monsters = cls.get_alt_monsters_and_evos(dbcog, monster)
-        id_queried_props = await IdViewState.do_query(dbcog, monster)
+        id_queried_props = IdViewState.do_query(dbcog, monster)
 
         raw_query = ims['raw_query']
         # This is to support the 2 vs 1 monster query difference between ^ls and ^id
@@ -101,21 +109,26 @@ class IdViewState(ViewStateBaseId):
     async def set_server(self, dbcog, server: Server):
         self.query_settings.server = server
         self.monster = dbcog.database.graph.get_monster(self.monster.monster_id, server=server)
-        self.alt_monsters = self.get_alt_monsters_and_evos(dbcog, self.monster)
-        id_queried_props = await self.do_query(dbcog, self.monster)
+        self.set_alt_monsters(self.get_alt_monsters_and_evos(dbcog, self.monster))
+        id_queried_props = self.do_query(dbcog, self.monster)
         self.transform_base = id_queried_props.transform_base
         self.true_evo_type_raw = id_queried_props.true_evo_type_raw
         self.acquire_raw = id_queried_props.acquire_raw
         self.base_rarity = id_queried_props.base_rarity
 
     @classmethod
-    async def do_query(cls, dbcog, monster) -> IdQueriedProps:
+    def do_query(cls, dbcog, monster) -> IdQueriedProps:
         db_context = dbcog.database
-        id_queried_props = await IdViewState._get_monster_misc_info(db_context, monster)
+        id_queried_props = IdViewState._get_monster_misc_info(db_context, monster)
         return id_queried_props
 
     @classmethod
-    async def _get_monster_misc_info(cls, db_context: "DbContext", monster) -> IdQueriedProps:
+    def _get_monster_misc_info(cls, db_context: "DbContext", monster) -> IdQueriedProps:
+        return _misc_info_cache.get(db_context, (monster.monster_id, monster.server_priority),
+                                    lambda: cls._query_monster_misc_info(db_context, monster))
+
+    @staticmethod
+    def _query_monster_misc_info(db_context: "DbContext", monster) -> IdQueriedProps:
         transform_base = db_context.graph.get_transform_base(monster)
         true_evo_type_raw = db_context.graph.true_evo_type(monster).value
         acquire_raw = db_context.graph.monster_acquisition(monster)
@@ -152,17 +165,17 @@ def _get_awakening_emoji_for_stats(m: "MonsterModel", i: int):
     return get_awakening_emoji(i) if m.awakening_count(i) and not m.is_equip else ''
 
 
-def _get_stat_text(stat, lb_stat, icon):
-    return Box(
-        Text(str(stat)),
-        Text("({})".format(lb_stat)) if lb_stat else None,
-        Text(icon) if icon else None,
-        delimiter=' '
-    )
+def _get_stat_text(stat, lb_stat, icon) -> str:
+    text = str(stat)
+    if lb_stat:
+        text += " ({})".format(lb_stat)
+    if icon:
+        text += " " + icon
+    return text
 
 
 def _monster_is_enhance(m: "MonsterModel"):
-    return any(x if x.name == 'Enhance' else None for x in m.types)
+    return 'Enhance' in m.type_names
 
 
 class IdView(BaseIdMainView, EvoScrollView):
@@ -172,18 +185,24 @@ class IdView(BaseIdMainView, EvoScrollView):
     def all_awakenings_row(cls, m: "MonsterModel", transform_base):
         if len(m.awakenings) == 0:
             return Box(Text('No Awakenings'))
+        if m == transform_base:
+            return cls._awakenings_rows(m, '')
+
+        if len(transform_base.awakenings) == 0:
+            transform_base_row = Box(Text('No Awakenings'))
+        else:
+            transform_base_row = cls._awakenings_rows(transform_base, '')
+        return cls._awakenings_rows(
+            m,
+            get_emoji(cls.up_emoji_name),
+            Box('\N{DOWN-POINTING RED TRIANGLE}', transform_base_row, delimiter=' ')
+        )
 
+    @classmethod
+    def _awakenings_rows(cls, m: "MonsterModel", prefix: str, middle_row: Optional[Box] = None):
         return Box(
-            Box(
-                get_emoji(cls.up_emoji_name) if m != transform_base else '',
-                cls.normal_awakenings_row(m),
-                delimiter=' '
-            ),
-            Box(
-                '\N{DOWN-POINTING RED TRIANGLE}',
-                IdView.all_awakenings_row(transform_base, transform_base),
-                delimiter=' '
-            ) if m != transform_base else None,
+            Box(prefix, cls.normal_awakenings_row(m), delimiter=' '),
+            middle_row,
             cls.super_awakenings_row(m),
         )
 
@@ -205,8 +224,7 @@ class IdView(BaseIdMainView, EvoScrollView):
         return Box(rarity, cost, series, acquire, true_evo_type)
 
     @classmethod
-    def stats(cls, m: "MonsterModel", previous_evolutions, query_settings: QuerySettings):
-        plus = cls.get_plus_status(previous_evolutions, query_settings.cardplus)
+    def stats(cls, m: "MonsterModel", plus: int, query_settings: QuerySettings):
         multiplayer = query_settings.cardmode == CardModeModifier.coop
         lb_level = 110 if query_settings.cardlevel == CardLevelModifier.lv110 else 120
         hp, atk, rcv, weighted = m.stats(plus=plus, multiplayer=multiplayer)
@@ -226,25 +244,22 @@ class IdView(BaseIdMainView, EvoScrollView):
     def get_plus_status(previous_evolutions: List["MonsterModel"], cardplus: CardPlusModifier):
         if cardplus == CardPlusModifier.plus0:
             return 0
-        if all([m.level == 1 and m.is_material for m in previous_evolutions]):
+        if all(m.level == 1 and m.is_material for m in previous_evolutions):
             return 0
         return 297 if cardplus == CardPlusModifier.plus297 else 0
 
     @classmethod
-    def stats_header(cls, m: "MonsterModel", previous_evolutions, query_settings: QuerySettings):
+    def stats_header(cls, m: "MonsterModel", plus: int, query_settings: QuerySettings):
         voice_emoji = get_awakening_emoji(63) if m.awakening_count(63) and not m.is_equip else ''
 
         multiboost_emoji = None
         if m.awakening_count(30) and query_settings.cardmode == CardModeModifier.coop:
             multiboost_emoji = get_emoji('misc_multiboost')
 
-        plus_emoji = get_emoji('plus_297')
-        if cls.get_plus_status(previous_evolutions, query_settings.cardplus) != 297:
-            plus_emoji = get_emoji('plus_0')
+        plus_emoji = get_emoji('plus_297' if plus == 297 else 'plus_0')
 
-        lb_emoji = get_emoji('lv110')
-        if m.limit_mult > 0 and query_settings.cardlevel == CardLevelModifier.lv120:
-            lb_emoji = get_emoji('lv120')
+        lb_emoji = get_emoji('lv120' if m.limit_mult > 0 and query_settings.cardlevel == CardLevelModifier.lv120
+                             else 'lv110')
 
         header = Box(
             Text(voice_emoji),
@@ -259,6 +274,7 @@ class IdView(BaseIdMainView, EvoScrollView):
     @classmethod
     def embed(cls, state: IdViewState):
         m = state.monster
+        plus = cls.get_plus_status(state.previous_evolutions, state.query_settings.cardplus)
         fields = [
             EmbedField(
                 '/'.join(['{}'.format(t.name) for t in m.types]),
@@ -273,8 +289,8 @@ class IdView(BaseIdMainView, EvoScrollView):
                 inline=True
             ),
             EmbedField(
-                IdView.stats_header(m, state.previous_evolutions, state.query_settings).to_markdown(),
-                IdView.stats(m, state.previous_evolutions, state.query_settings),
+                IdView.stats_header(m, plus, state.query_settings).to_markdown(),
+                IdView.stats(m, plus, state.query_settings),
                 inline=True
             ),
             EmbedField(